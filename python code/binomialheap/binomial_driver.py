@@ -1,16 +1,22 @@
 """
 Interactive CLI for Binomial Heap operations
 Supports: Make-heap, Insert, Minimum, ExtractMin, Union, Decrease-Key, Delete
+Run with --pairing to back the CLI with a Pairing Heap instead.
 """
-from binomial_heap import BinomialHeap, BinomialNode, INT_MAX
+from binomial_heap import BinomialHeap
+from pairing_heap import PairingHeap
+import itertools
 import sys
 
 
 class InteractiveBinomialHeap:
-    def __init__(self):
-        self.heap = BinomialHeap()
-        self.node_map = {}  # Maps node IDs to actual nodes for decrease/delete operations
-        self.next_node_id = 0
+    def __init__(self, heap_class=BinomialHeap):
+        self.heap_class = heap_class  # BinomialHeap or PairingHeap
+        self.heap = heap_class()
+        self.node_map = {}  # Maps node IDs to heap handles for decrease/delete operations
+        self.id_of = {}  # Maps id(handle) back to its node ID for O(1) removal
+        self._ids = itertools.count()  # Source of node IDs
+        self._quiet = False  # Set when input is piped; skips decorative output
     
     def display_menu(self):
         """Display the main menu"""
@@ -22,21 +28,26 @@ class InteractiveBinomialHeap:
         print("         9) Show Nodes  0) Exit")
         print("="*60)
     
+    def _ask(self, prompt: str) -> str:
+        """Read a line of input, showing the prompt only in interactive runs"""
+        return input("" if self._quiet else prompt)
+    
     def make_heap(self):
         """Make-Heap operation"""
-        self.heap = BinomialHeap()
+        self.heap = self.heap_class()
         self.node_map = {}
-        self.next_node_id = 0
+        self.id_of = {}
+        self._ids = itertools.count()
         print("✓ New empty heap created!")
     
     def insert(self):
         """Insert operation"""
         try:
-            key = int(input("Enter the key to insert: "))
-            node = self.heap.insert(key)
-            node_id = self.next_node_id
-            self.node_map[node_id] = node
-            self.next_node_id += 1
+            key = int(self._ask("Enter the key to insert: "))
+            handle = self.heap.insert(key)
+            node_id = next(self._ids)
+            self.node_map[node_id] = handle
+            self.id_of[id(handle)] = node_id
             print(f"✓ Inserted key {key} (Node ID: {node_id})")
         except ValueError:
             print("✗ Invalid input. Please enter an integer.")
@@ -55,66 +66,40 @@ class InteractiveBinomialHeap:
             print("✗ Heap is empty!")
             return
         
-        min_val = self.heap.extract_min()
+        # Take the handle first: extract_min detaches it from the node
+        handle = self.heap.find_min().handle
+        min_val, min_node = self.heap.extract_min()
         
-        if min_val == INT_MAX:
+        if min_node is None:
             print("✗ Heap is empty!")
             return
         
-        # Clean up node_map: remove the extracted node
-        # We need to identify which node had this value and was extracted
-        # Since extract_min removes the min node, we should clean up invalid references
-        nodes_to_remove = []
-        for nid, node in self.node_map.items():
-            # Check if node is still in the heap by traversing from roots
-            if not self._node_in_heap(node):
-                nodes_to_remove.append(nid)
-        
-        for nid in nodes_to_remove:
-            del self.node_map[nid]
+        # Stop tracking the key that left the heap
+        self._untrack(handle)
         
         print(f"✓ Extracted minimum: {min_val}")
     
-    def _node_in_heap(self, target_node):
-        """Check if a node is still in the heap"""
-        if self.heap.head is None:
-            return False
-        
-        # BFS through all nodes in the heap
-        visited = set()
-        stack = [self.heap.head]
-        
-        while stack:
-            node = stack.pop()
-            if node is None or id(node) in visited:
-                continue
-            
-            visited.add(id(node))
-            
-            if node is target_node:
-                return True
-            
-            if node.child:
-                stack.append(node.child)
-            if node.sibling:
-                stack.append(node.sibling)
-        
-        return False
+    def _untrack(self, handle):
+        """Remove a handle whose key has left the heap from the tracked nodes"""
+        node_id = self.id_of.pop(id(handle), None)
+        if node_id is not None:
+            del self.node_map[node_id]
     
     def union(self):
         """Union operation"""
         print("\nCreating a second heap to union with...")
         try:
-            num_elements = int(input("How many elements in the second heap? "))
+            num_elements = int(self._ask("How many elements in the second heap? "))
             if num_elements < 0:
                 print("✗ Number must be non-negative.")
                 return
             
-            other_heap = BinomialHeap()
+            other_heap = self.heap_class()
+            insert = other_heap.insert
             print(f"Enter {num_elements} keys for the second heap:")
             for i in range(num_elements):
-                key = int(input(f"  Key {i+1}: "))
-                other_heap.insert(key)
+                key = int(self._ask(f"  Key {i+1}: "))
+                insert(key)
             
             print("\nFirst heap (before union):")
             self.heap.print_tree()
@@ -136,27 +121,21 @@ class InteractiveBinomialHeap:
             
         self.show_nodes()
         try:
-            node_id = int(input("Enter the Node ID to decrease: "))
+            node_id = int(self._ask("Enter the Node ID to decrease: "))
             if node_id not in self.node_map:
                 print("✗ Invalid Node ID!")
                 return
             
-            node = self.node_map[node_id]
-            
-            # Verify node is still in heap
-            if not self._node_in_heap(node):
-                print(f"✗ Node ID {node_id} is no longer in the heap!")
-                del self.node_map[node_id]
-                return
+            node = self.node_map[node_id].node
             
             print(f"Current key value: {node.key}")
-            new_key = int(input("Enter the new key value: "))
+            new_key = int(self._ask("Enter the new key value: "))
             
             if new_key > node.key:
                 print(f"✗ New key ({new_key}) must be <= current key ({node.key})")
                 return
             
-            result = self.heap.decrease_key(node, new_key)
+            result = self.heap.decrease_key(self.node_map[node_id], new_key)
             if result is None:
                 print("✗ Decrease key operation failed!")
             else:
@@ -172,26 +151,20 @@ class InteractiveBinomialHeap:
             
         self.show_nodes()
         try:
-            node_id = int(input("Enter the Node ID to delete: "))
+            node_id = int(self._ask("Enter the Node ID to delete: "))
             if node_id not in self.node_map:
                 print("✗ Invalid Node ID!")
                 return
             
-            node = self.node_map[node_id]
-            
-            # Verify node is still in heap
-            if not self._node_in_heap(node):
-                print(f"✗ Node ID {node_id} is no longer in the heap!")
-                del self.node_map[node_id]
-                return
+            handle = self.node_map[node_id]
             
-            original_key = node.key
-            deleted_val = self.heap.delete_node(node)
+            original_key = handle.node.key
+            _, removed = self.heap.delete_node(handle)
             
-            if deleted_val == INT_MAX:
+            if removed is None:
                 print("✗ Delete operation failed!")
             else:
-                del self.node_map[node_id]
+                self._untrack(handle)
                 print(f"✓ Successfully deleted node {node_id} (key was {original_key})")
         except ValueError:
             print("✗ Invalid input. Please enter an integer.")
@@ -206,37 +179,31 @@ class InteractiveBinomialHeap:
     
     def show_nodes(self):
         """Show all tracked nodes with their IDs"""
-        if not self.node_map:
-            print("\n✗ No tracked nodes in heap!")
-            return
-        
-        # Clean up stale references
-        valid_nodes = {}
-        for node_id, node in self.node_map.items():
-            if self._node_in_heap(node):
-                valid_nodes[node_id] = node
-        
-        self.node_map = valid_nodes
-        
         if not self.node_map:
             print("\n✗ No tracked nodes in heap!")
             return
         
         print("\nTracked nodes:")
         print("-" * 40)
-        for node_id, node in sorted(self.node_map.items()):
-            print(f"  Node ID {node_id}: key = {node.key}")
+        for node_id, handle in sorted(self.node_map.items()):
+            print(f"  Node ID {node_id}: key = {handle.node.key}")
         print("-" * 40)
     
     def run(self):
         """Main interactive loop"""
-        print("\nWelcome to Binomial Heap Interactive CLI!")
+        if not sys.stdin.isatty():
+            # Scripted run: block-buffer output and drop the banners and menu
+            sys.stdout.reconfigure(line_buffering=False)
+            self._quiet = True
+        else:
+            print("\nWelcome to Binomial Heap Interactive CLI!")
         self.make_heap()
         
         while True:
-            self.display_menu()
+            if not self._quiet:
+                self.display_menu()
             try:
-                choice = input("Enter your choice (0-9): ").strip()
+                choice = self._ask("Enter your choice (0-9): ").strip()
                 
                 if choice == '0':
                     print("\nThank you for using Binomial Heap CLI. Goodbye!")
@@ -264,12 +231,17 @@ class InteractiveBinomialHeap:
             except KeyboardInterrupt:
                 print("\n\nInterrupted by user. Goodbye!")
                 sys.exit(0)
+            except EOFError:
+                # Input ran out, e.g. a piped script without a closing 0
+                print("\nExiting...")
+                sys.exit(0)
             except Exception as e:
                 print(f"✗ An error occurred: {e}")
 
 
 def main():
-    cli = InteractiveBinomialHeap()
+    heap_class = PairingHeap if "--pairing" in sys.argv[1:] else BinomialHeap
+    cli = InteractiveBinomialHeap(heap_class)
     cli.run()
 
 
@@ -6,8 +6,9 @@ Provides BinomialNode and BinomialHeap with basic operations:
 - extract_min()
 - find_min()
 - union_heaps(other)
-- decrease_key(node, new_key)
-- delete_node(node)
+- consolidate()
+- decrease_key(handle, new_key)
+- delete_node(handle)
 - level_order_traversal()
 """
 
@@ -20,20 +21,123 @@ INT_MIN = -sys.maxsize - 1
 
 
 class BinomialNode:
+    __slots__ = ('key', 'degree', 'parent', 'child', 'sibling', 'handle')
+
     def __init__(self, key: int):
         self.key = key
         self.degree = 0  # Number of children
         self.parent = None
         self.child = None
         self.sibling = None
+        self.handle = None  # Handle currently pointing at this node
 
     def __repr__(self):
         return f"BinomialNode(key={self.key}, degree={self.degree})"
 
 
-class BinomialHeap:
+class Handle:
+    """Stable reference to an inserted key.
+    decrease_key moves keys between nodes, so callers hold a Handle
+    and read handle.node to find the node currently holding their key.
+    Once the key leaves the heap, handle.node is None."""
+    __slots__ = ('node',)
+
+    def __init__(self, node: BinomialNode):
+        self.node: BinomialNode | None = node
+        node.handle = self
+
+    def __repr__(self):
+        if self.node is None:
+            return "Handle(detached)"
+        return f"Handle(key={self.node.key})"
+
+
+class HeapBase:
+    """Handle bookkeeping and printing shared by the heaps here.
+    Subclasses keep their trees in self.head and link nodes through
+    key/child/sibling/handle, in the left-child/right-sibling layout."""
+
+    def _detach_handle(self, node: BinomialNode) -> None:
+        """Invalidate the handle of a node that has left the heap"""
+        handle = node.handle
+        if handle is not None:
+            handle.node = None
+            node.handle = None
+
+    def level_order_traversal(self) -> None:
+        """Print level-order traversal of the heap"""
+        if self.head is None:
+            print()
+            return
+
+        q = deque()
+        q.append((self.head, 0))
+        cur_level = -1
+        lines = []  # One list of tokens per output line, written out at the end
+
+        while q:
+            node, level = q.popleft()
+
+            if level > cur_level:
+                cur_level = level
+                lines.append([f"Level {cur_level}:"])
+
+            lines[-1].append(str(node.key))
+
+            # Add child to queue
+            if node.child is not None:
+                q.append((node.child, level + 1))
+
+            # Add sibling to queue (same level)
+            if node.sibling is not None:
+                q.append((node.sibling, level))
+
+        sys.stdout.write("\n".join(" ".join(line) + " " for line in lines) + "\n")
+
+    def _print_subtree(self, node: BinomialNode, prefix: str, is_last: bool, out: list) -> None:
+        """Append the lines of a subtree drawn with tree branch characters to out,
+        using an explicit stack"""
+        if node is None:
+            return
+        
+        # Sibling subtrees repeat the same prefixes, so build each one only once
+        prefix_cache = {}  # (prefix, is_last) -> prefix for that node's children
+        
+        stack = [(node, prefix, is_last)]
+        while stack:
+            node, prefix, is_last = stack.pop()
+            
+            # Emit current node
+            connector = "└──" if is_last else "├──"
+            out.append("".join((prefix, connector, str(node.key))))
+            
+            if node.child is None:
+                continue
+            
+            # Prepare prefix for children
+            new_prefix = prefix_cache.get((prefix, is_last))
+            if new_prefix is None:
+                extension = "    " if is_last else "│   "
+                new_prefix = prefix_cache[prefix, is_last] = prefix + extension
+            
+            # Get all children as a list
+            children = []
+            child = node.child
+            while child:
+                children.append(child)
+                child = child.sibling
+            
+            # Push children in reverse so the first child is printed first
+            is_last_child = True
+            for child_node in reversed(children):
+                stack.append((child_node, new_prefix, is_last_child))
+                is_last_child = False
+
+
+class BinomialHeap(HeapBase):
     def __init__(self):
         self.head: BinomialNode | None = None
+        self.min: BinomialNode | None = None  # Root holding the minimum key
 
     def _link_trees(self, y: BinomialNode, z: BinomialNode):
         """Link two binomial trees of the same degree.
@@ -43,203 +147,213 @@ class BinomialHeap:
         z.child = y
         z.degree += 1
 
-    def _merge_root_lists(self, h1: BinomialNode | None, h2: BinomialNode | None) -> BinomialNode | None:
-        """Merge two root lists in order of increasing degree"""
-        if not h1:
-            return h2
-        if not h2:
-            return h1
-
-        # Start with the tree of smaller degree
-        if h1.degree <= h2.degree:
-            merged = h1
-            h1 = h1.sibling
-        else:
-            merged = h2
-            h2 = h2.sibling
-
-        curr = merged
-
-        # Merge the rest by degree
-        while h1 and h2:
-            if h1.degree <= h2.degree:
-                curr.sibling = h1
-                h1 = h1.sibling
-            else:
-                curr.sibling = h2
-                h2 = h2.sibling
-            curr = curr.sibling
-
-        # Attach remaining trees
-        if h1:
-            curr.sibling = h1
-        else:
-            curr.sibling = h2
-
-        return merged
-
     def _consolidate(self, head: BinomialNode | None) -> BinomialNode | None:
-        """Consolidate the heap so no two roots have the same degree"""
+        """Consolidate the heap so no two roots have the same degree.
+        Roots may arrive in any order; the result is ordered by increasing degree."""
         if not head:
             return None
 
-        prev = None
+        # Collect the roots, counting nodes as we go: a B_d tree holds 2**d
+        # nodes, so no consolidated degree can reach size.bit_length()
+        roots = []
+        size = 0
         curr = head
-        next_node = curr.sibling
-
-        while next_node:
-            # Case 1 & 2: degrees are different, move forward
-            if (curr.degree != next_node.degree or 
-                (next_node.sibling and next_node.sibling.degree == curr.degree)):
-                prev = curr
-                curr = next_node
-            # Case 3: curr.key <= next.key, link next under curr
-            elif curr.key <= next_node.key:
-                curr.sibling = next_node.sibling
-                self._link_trees(next_node, curr)
-            # Case 4: curr.key > next.key, link curr under next
-            else:
-                if prev is None:
-                    head = next_node
-                else:
-                    prev.sibling = next_node
-                self._link_trees(curr, next_node)
-                curr = next_node
+        while curr:
+            roots.append(curr)
+            size += 1 << curr.degree
+            curr = curr.sibling
 
-            next_node = curr.sibling
+        # by_degree[d] holds the root of degree d seen so far, if any
+        by_degree = [None] * size.bit_length()
+        link = self._link_trees
+
+        for curr in roots:
+            degree = curr.degree
+
+            # Link equal-degree roots until curr lands in an empty slot
+            while by_degree[degree] is not None:
+                other = by_degree[degree]
+                by_degree[degree] = None
+                if other.key <= curr.key:
+                    curr, other = other, curr
+                link(other, curr)
+                degree += 1
+
+            by_degree[degree] = curr
+
+        # Relink the surviving roots into a sibling chain
+        head = None
+        tail = None
+        for root in by_degree:
+            if root is None:
+                continue
+            if tail is None:
+                head = root
+            else:
+                tail.sibling = root
+            tail = root
+        tail.sibling = None
 
         return head
 
-    def insert(self, key: int) -> BinomialNode:
-        """Insert a new key into the heap"""
+    def _remove_root(self, root: BinomialNode) -> None:
+        """Unlink a tree from the root list"""
+        if root is self.head:
+            self.head = root.sibling
+        else:
+            prev = self.head
+            while prev.sibling is not root:
+                prev = prev.sibling
+            prev.sibling = root.sibling
+        root.sibling = None
+
+    def insert(self, key: int) -> Handle:
+        """Insert a new key into the heap and return a handle to it"""
         new_node = BinomialNode(key)
         new_node.degree = 0
+        handle = Handle(new_node)
+
+        if self.min is None or new_node.key < self.min.key:
+            self.min = new_node
         
-        # Merge with existing heap
-        self.head = self._merge_root_lists(self.head, new_node)
-        self.head = self._consolidate(self.head)
+        # Lazy insert: push onto the root list and leave consolidation to extract_min
+        new_node.sibling = self.head
+        self.head = new_node
         
-        return new_node
+        return handle
 
     def find_min(self) -> BinomialNode | None:
         """Find the node with minimum key"""
-        if not self.head:
-            return None
-        
-        min_node = self.head
-        curr = self.head.sibling
-        
-        while curr:
-            if curr.key < min_node.key:
-                min_node = curr
-            curr = curr.sibling
-        
-        return min_node
+        return self.min
 
-    def extract_min(self) -> int:
-        """Extract and return the minimum key"""
+    def extract_min(self) -> tuple[int, BinomialNode | None]:
+        """Extract the minimum and return (key, node that left the heap).
+        Returns (INT_MAX, None) when the heap is empty."""
         if not self.head:
-            return INT_MAX
-
-        # Find minimum node and its predecessor
-        min_node = self.head
-        min_prev = None
-        curr = self.head
-        prev = None
-
-        while curr.sibling:
-            if curr.sibling.key < min_node.key:
-                min_node = curr.sibling
-                min_prev = curr
-            prev = curr
-            curr = curr.sibling
+            return INT_MAX, None
 
-        # Remove min_node from root list
-        if min_node == self.head:
-            self.head = min_node.sibling
-        else:
-            min_prev.sibling = min_node.sibling
+        min_node = self.min
+        self._remove_root(min_node)
 
-        # Reverse the children list of min_node
+        # Splice min_node's children onto the root list. _consolidate accepts
+        # roots in any order, so the child list is used as-is, not reversed.
         child = min_node.child
-        new_head = None
-        
-        while child:
-            next_child = child.sibling
-            child.sibling = new_head
+        if child:
             child.parent = None
-            new_head = child
-            child = next_child
-
-        # Merge the reversed children list with the main heap
-        self.head = self._merge_root_lists(self.head, new_head)
+            while child.sibling:
+                child = child.sibling
+                child.parent = None
+            child.sibling = self.head
+            self.head = min_node.child
+
+        self.consolidate()
+        self._detach_handle(min_node)
+        return min_node.key, min_node
+
+    def consolidate(self) -> None:
+        """Link equal-degree roots now rather than at the next extract_min"""
         self.head = self._consolidate(self.head)
 
-        return min_node.key
+        # Linking can bury a root whose key ties the minimum, so rebuild the
+        # minimum pointer in a single sweep of the roots
+        self.min = None
+        curr = self.head
+        while curr:
+            if self.min is None or curr.key < self.min.key:
+                self.min = curr
+            curr = curr.sibling
 
     def union_heaps(self, other: 'BinomialHeap') -> BinomialNode | None:
         """Union this heap with another heap"""
-        self.head = self._merge_root_lists(self.head, other.head)
-        self.head = self._consolidate(self.head)
+        if other.min is not None and (self.min is None or other.min.key < self.min.key):
+            self.min = other.min
+        # Root lists may be in any order, so other's roots go in front of ours.
+        # Only other's list is walked: ours holds a root per lazy insert.
+        # Consolidation is deferred until the next extract_min.
+        if other.head is not None:
+            tail = other.head
+            while tail.sibling:
+                tail = tail.sibling
+            tail.sibling = self.head
+            self.head = other.head
         other.head = None
+        other.min = None
         return self.head
 
-    def decrease_key(self, node: BinomialNode | None, new_key: int) -> BinomialNode | None:
-        """Decrease the key of a node"""
-        if node is None or new_key > node.key:
+    def decrease_key(self, handle: Handle | None, new_key: int) -> Handle | None:
+        """Decrease the key referenced by a handle"""
+        if handle is None or handle.node is None or new_key > handle.node.key:
             return None
 
-        node.key = new_key
-        curr = node
+        curr = handle.node
+        curr.key = new_key
         parent = curr.parent
 
         # Bubble up to maintain heap property
         while parent and curr.key < parent.key:
-            # Swap keys
+            # Swap keys, and handles with them so each handle follows its key
             curr.key, parent.key = parent.key, curr.key
+            curr.handle, parent.handle = parent.handle, curr.handle
+            curr.handle.node = curr
+            parent.handle.node = parent
             curr = parent
             parent = curr.parent
 
-        return node
-
-    def delete_node(self, node: BinomialNode | None) -> int:
-        """Delete a specific node from the heap"""
-        if node is None:
-            return INT_MAX
-        
-        self.decrease_key(node, INT_MIN)
-        return self.extract_min()
+        if parent is None and curr.key <= self.min.key:
+            self.min = curr
 
-    def level_order_traversal(self) -> None:
-        """Print level-order traversal of the heap"""
-        if self.head is None:
-            print()
-            return
+        return handle
 
-        q = deque()
-        q.append((self.head, 0))
-        cur_level = -1
-
-        while q:
-            node, level = q.popleft()
-
-            if level > cur_level:
-                if cur_level >= 0:
-                    print()
-                cur_level = level
-                print(f"Level {cur_level}:", end=" ")
-
-            print(node.key, end=" ")
-
-            # Add child to queue
-            if node.child is not None:
-                q.append((node.child, level + 1))
-
-            # Add sibling to queue (same level)
-            if node.sibling is not None:
-                q.append((node.sibling, level))
-
-        print()
+    def delete_node(self, handle: Handle | None) -> tuple[int, BinomialNode | None]:
+        """Delete the key referenced by a handle from the heap.
+        Returns (key, node) like extract_min, or (INT_MAX, None) for no handle
+        or one whose key has already left the heap."""
+        if handle is None or handle.node is None:
+            return INT_MAX, None
+        
+        node = handle.node
+        if node is self.min:
+            return self.extract_min()
+
+        # Find the root of node's tree and take that tree off the root list
+        root = node
+        while root.parent:
+            root = root.parent
+        self._remove_root(root)
+
+        # Walk up from node to the root, splitting the tree along that path:
+        # every child hanging off the path becomes a root of its own, and each
+        # ancestor goes back in as a B0. The pieces are consolidated at the
+        # end so the root list stays O(log n) for the next delete.
+        ancestors = []
+        curr = node
+        path_child = None  # The child of curr that lies on the path
+        while curr:
+            child = curr.child
+            while child:
+                next_child = child.sibling
+                if child is not path_child:
+                    child.parent = None
+                    child.sibling = self.head
+                    self.head = child
+                child = next_child
+
+            if curr is not node:
+                ancestors.append(curr)
+            path_child = curr
+            curr = curr.parent
+
+        # Re-add the ancestors only now, as their sibling links were still
+        # needed while walking their parents' child lists
+        for curr in ancestors:
+            curr.parent = curr.child = None
+            curr.degree = 0
+            curr.sibling = self.head
+            self.head = curr
+
+        self.consolidate()
+        self._detach_handle(node)
+        return node.key, node
 
     def print_tree(self) -> None:
         """Print heap in tree format with branch characters
@@ -249,39 +363,17 @@ class BinomialHeap:
             print("(empty heap)")
             return
         
-        # Print each root tree
+        # Collect each root tree's lines and write them out in one call
+        out = []
         root = self.head
         tree_num = 0
         while root:
-            print(f"\nBinomial Tree B{root.degree} (root: {root.key}):")
-            self._print_subtree(root, "", True)
+            out.append("")
+            out.append(f"Binomial Tree B{root.degree} (root: {root.key}):")
+            self._print_subtree(root, "", True, out)
             root = root.sibling
             tree_num += 1
-    
-    def _print_subtree(self, node: BinomialNode, prefix: str, is_last: bool) -> None:
-        """Recursively print a subtree with tree branch characters"""
-        if node is None:
-            return
-        
-        # Print current node
-        connector = "└──" if is_last else "├──"
-        print(f"{prefix}{connector}{node.key}")
-        
-        # Prepare prefix for children
-        extension = "    " if is_last else "│   "
-        new_prefix = prefix + extension
-        
-        # Get all children as a list
-        children = []
-        child = node.child
-        while child:
-            children.append(child)
-            child = child.sibling
-        
-        # Print each child
-        for i, child_node in enumerate(children):
-            is_last_child = (i == len(children) - 1)
-            self._print_subtree(child_node, new_prefix, is_last_child)
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == '__main__':
@@ -296,6 +388,8 @@ if __name__ == '__main__':
         heap.insert(k)
     print(values)
     
+    # Inserts only push B0 roots; link them up so there are trees to show
+    heap.consolidate()
     print("\nHeap structure (tree view):")
     heap.print_tree()
     
@@ -303,7 +397,7 @@ if __name__ == '__main__':
     print("Extracting minimum values:")
     print("="*60)
     while heap.head:
-        min_k = heap.extract_min()
+        min_k, _ = heap.extract_min()
         print(f"\nExtracted: {min_k}")
         if heap.head:
             heap.print_tree()
@@ -318,6 +412,8 @@ if __name__ == '__main__':
         heap1.insert(i)
     for i in [3, 8, 20]:
         heap2.insert(i)
+    heap1.consolidate()
+    heap2.consolidate()
     
     print("\nHeap 1:")
     heap1.print_tree()
@@ -325,22 +421,24 @@ if __name__ == '__main__':
     heap2.print_tree()
     
     heap1.union_heaps(heap2)
-    print("\nAfter union:")
+    heap1.consolidate()
+    print("\nAfter union (consolidated):")
     heap1.print_tree()
     
     print("\n" + "="*60)
     print("Testing Decrease Key")
     print("="*60)
     heap3 = BinomialHeap()
-    nodes = []
+    handles = []
     for i in [50, 30, 20, 10]:
-        node = heap3.insert(i)
-        nodes.append(node)
+        handle = heap3.insert(i)
+        handles.append(handle)
+    heap3.consolidate()
     
     print("\nBefore decrease key:")
     heap3.print_tree()
     
     print("\nDecreasing key of node with value 50 to 5:")
-    heap3.decrease_key(nodes[0], 5)
+    heap3.decrease_key(handles[0], 5)
     heap3.print_tree()
     print(f"\nNew minimum: {heap3.find_min().key}")
\ No newline at end of file
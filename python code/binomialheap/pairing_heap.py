@@ -0,0 +1,155 @@
+"""
+pairing_heap.py
+Pairing Heap with the same interface as BinomialHeap, so the CLI can use either.
+Trees use the left-child/right-sibling representation:
+- insert(key)            O(1)
+- extract_min()          O(log n) amortized (two-pass pairing)
+- find_min()             O(1)
+- union_heaps(other)     O(1)
+- decrease_key(handle, new_key)
+- delete_node(handle)
+- level_order_traversal()
+"""
+
+import sys
+
+from binomial_heap import HeapBase, Handle, INT_MAX
+
+
+class PairingNode:
+    __slots__ = ('key', 'child', 'sibling', 'prev', 'handle')
+
+    def __init__(self, key: int):
+        self.key = key
+        self.child = None  # Leftmost child
+        self.sibling = None  # Next sibling to the right
+        self.prev = None  # Left sibling, or parent if this is the leftmost child
+        self.handle = None  # Handle pointing at this node
+
+    def __repr__(self):
+        return f"PairingNode(key={self.key})"
+
+
+class PairingHeap(HeapBase):
+    def __init__(self):
+        self.head: PairingNode | None = None  # Root of the single heap-ordered tree
+
+    def _meld(self, a: PairingNode | None, b: PairingNode | None) -> PairingNode | None:
+        """Meld two roots; the larger one becomes the leftmost child of the smaller.
+        On equal keys a stays on top."""
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if b.key < a.key:
+            a, b = b, a
+
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+        return a
+
+    def _merge_pairs(self, first: PairingNode | None) -> PairingNode | None:
+        """Two-pass pairing of a sibling list into a single tree"""
+        meld = self._meld
+
+        # Left-to-right pass: meld siblings in pairs
+        pairs = []
+        node = first
+        while node:
+            a = node
+            b = node.sibling
+            node = b.sibling if b else None
+            a.sibling = a.prev = None
+            if b:
+                b.sibling = b.prev = None
+            pairs.append(meld(a, b))
+
+        # Right-to-left pass: meld each pair into the accumulated tree
+        root = None
+        for tree in reversed(pairs):
+            root = meld(tree, root)
+        return root
+
+    def _cut(self, node: PairingNode) -> None:
+        """Detach a non-root node (with its subtree) from its parent"""
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling:
+            node.sibling.prev = node.prev
+        node.sibling = node.prev = None
+
+    def insert(self, key: int) -> Handle:
+        """Insert a new key into the heap and return a handle to it"""
+        new_node = PairingNode(key)
+        handle = Handle(new_node)
+        self.head = self._meld(self.head, new_node)
+        return handle
+
+    def find_min(self) -> PairingNode | None:
+        """Find the node with minimum key"""
+        return self.head
+
+    def extract_min(self) -> tuple[int, PairingNode | None]:
+        """Extract the minimum and return (key, node that left the heap).
+        Returns (INT_MAX, None) when the heap is empty."""
+        min_node = self.head
+        if min_node is None:
+            return INT_MAX, None
+
+        self.head = self._merge_pairs(min_node.child)
+        min_node.child = None
+        self._detach_handle(min_node)
+        return min_node.key, min_node
+
+    def union_heaps(self, other: 'PairingHeap') -> PairingNode | None:
+        """Union this heap with another heap"""
+        self.head = self._meld(self.head, other.head)
+        other.head = None
+        return self.head
+
+    def decrease_key(self, handle: Handle | None, new_key: int) -> Handle | None:
+        """Decrease the key referenced by a handle"""
+        if handle is None or handle.node is None or new_key > handle.node.key:
+            return None
+
+        node = handle.node
+        node.key = new_key
+        if node is not self.head:
+            # Cut the subtree out and meld it back in at the root
+            self._cut(node)
+            self.head = self._meld(node, self.head)
+
+        return handle
+
+    def delete_node(self, handle: Handle | None) -> tuple[int, PairingNode | None]:
+        """Delete the key referenced by a handle from the heap.
+        Returns (key, node) like extract_min, or (INT_MAX, None) for no handle
+        or one whose key has already left the heap."""
+        if handle is None or handle.node is None:
+            return INT_MAX, None
+
+        node = handle.node
+        if node is self.head:
+            return self.extract_min()
+
+        # Cut the node out, pair up its children and meld them back in
+        self._cut(node)
+        self.head = self._meld(self.head, self._merge_pairs(node.child))
+        node.child = None
+        self._detach_handle(node)
+        return node.key, node
+
+    def print_tree(self) -> None:
+        """Print heap in tree format with branch characters"""
+        if self.head is None:
+            print("(empty heap)")
+            return
+
+        out = ["", f"Pairing Heap (root: {self.head.key}):"]
+        self._print_subtree(self.head, "", True, out)
+        sys.stdout.write("\n".join(out) + "\n")
@@ -0,0 +1,104 @@
+import random
+import unittest
+
+from binomial_heap import BinomialHeap, INT_MAX
+from pairing_heap import PairingHeap
+
+
+class HeapTests:
+    """Randomized checks against a sorted reference, run for each heap class"""
+    heap_class = None
+
+    def check_handles(self, heap, expected: dict) -> None:
+        """Every live handle still reaches its key, and find_min agrees"""
+        for handle, key in expected.items():
+            self.assertIsNotNone(handle.node)
+            self.assertIs(handle.node.handle, handle)
+            self.assertEqual(handle.node.key, key)
+        if expected:
+            self.assertEqual(heap.find_min().key, min(expected.values()))
+        else:
+            self.assertIsNone(heap.find_min())
+
+    def test_random_operations(self):
+        for seed in range(100):
+            with self.subTest(seed=seed):
+                rnd = random.Random(seed)
+                heap = self.heap_class()
+                expected = {}  # Live handle -> the key it should hold
+                gone = []  # Handles whose key has left the heap
+                for _ in range(200):
+                    op = rnd.random()
+                    if op < 0.4 or not expected:
+                        key = rnd.randint(0, 50)
+                        expected[heap.insert(key)] = key
+                    elif op < 0.6:
+                        key, node = heap.extract_min()
+                        self.assertEqual(key, min(expected.values()))
+                        # The extracted key's handle is the one that was detached
+                        left = [h for h in expected if h.node is None]
+                        self.assertEqual(len(left), 1)
+                        self.assertEqual(expected.pop(left[0]), key)
+                        gone.append(left[0])
+                    elif op < 0.8:
+                        handle = rnd.choice(list(expected))
+                        new_key = expected[handle] - rnd.randint(0, 20)
+                        self.assertIs(heap.decrease_key(handle, new_key), handle)
+                        expected[handle] = new_key
+                    else:
+                        handle = rnd.choice(list(expected))
+                        key, node = heap.delete_node(handle)
+                        self.assertIsNotNone(node)
+                        self.assertEqual(key, expected.pop(handle))
+                        self.assertIsNone(handle.node)
+                        gone.append(handle)
+                    self.check_handles(heap, expected)
+
+                # Handles of keys that already left the heap are rejected
+                for handle in gone[:5]:
+                    self.assertIsNone(heap.decrease_key(handle, -100))
+                    self.assertEqual(heap.delete_node(handle), (INT_MAX, None))
+                self.check_handles(heap, expected)
+
+                drained = []
+                while heap.head is not None:
+                    drained.append(heap.extract_min()[0])
+                self.assertEqual(drained, sorted(expected.values()))
+                self.assertEqual(heap.extract_min(), (INT_MAX, None))
+
+    def test_union(self):
+        rnd = random.Random(1)
+        heap = self.heap_class()
+        other = self.heap_class()
+        keys = []
+        for target in (heap, other):
+            for _ in range(30):
+                key = rnd.randint(0, 100)
+                target.insert(key)
+                keys.append(key)
+            # Mix consolidated trees with lazily inserted roots
+            keys.remove(target.extract_min()[0])
+            for _ in range(5):
+                key = rnd.randint(0, 100)
+                target.insert(key)
+                keys.append(key)
+        heap.union_heaps(other)
+        self.assertIsNone(other.head)
+        self.assertIsNone(other.find_min())
+        self.assertEqual(heap.find_min().key, min(keys))
+        drained = []
+        while heap.head is not None:
+            drained.append(heap.extract_min()[0])
+        self.assertEqual(drained, sorted(keys))
+
+
+class TestBinomialHeap(HeapTests, unittest.TestCase):
+    heap_class = BinomialHeap
+
+
+class TestPairingHeap(HeapTests, unittest.TestCase):
+    heap_class = PairingHeap
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,124 +3,95 @@ hash.py
 Interactive program to analyze word frequencies with different MAXHASH values
 """
 
+import heapq
 import math
 import sys
+from collections import Counter
+from operator import itemgetter, mul
 from pathlib import Path
 
 
-def variance_calc(total_sum: int, n: int, bucket_sizes: list) -> float:
-    """
-    Calculate the variance of bucket sizes
-    
-    Args:
-        total_sum: Sum of all bucket values
-        n: Number of buckets
-        bucket_sizes: List of (index, size) tuples
-        
-    Returns:
-        Variance of bucket sizes
-    """
-    mean = total_sum / n
-    sq_diff = 0
-    
-    for _, size in bucket_sizes:
-        sq_diff += (size - mean) ** 2
-    
-    return sq_diff / n
-
-
-class Node:
-    def __init__(self, key: str, value: int):
-        self.key = key
-        self.value = value
-        self.next = None
-
-
 class HashTable:
     def __init__(self, maxhash: int = 30):
         self.maxhash = maxhash
-        self.buckets = [None] * self.maxhash
+        self.buckets = [[] for _ in range(self.maxhash)]  # Keys, grouped by hash
+        self.values = {}  # Key -> value; lookups and updates go through this dict
         self.count = 0
+        self._pow31 = [1 % self.maxhash]
     
     def hash(self, key: str) -> int:
-        hash_value = 0
-        for char in key:
-            hash_value = hash_value * 31 + ord(char)
-        return hash_value % self.maxhash
+        pow31 = self._pow31
+        if len(key) > len(pow31):
+            self._extend_powers(len(key))
+        # sum(ord(c) * 31**i) over the reversed key, with the loop run in C
+        return sum(map(mul, map(ord, reversed(key)), pow31)) % self.maxhash
+    
+    def _extend_powers(self, length: int) -> None:
+        pow31 = self._pow31
+        while len(pow31) < length:
+            pow31.append(pow31[-1] * 31 % self.maxhash)
     
     def insert(self, key: str, value: int) -> None:
-        index = self.hash(key)
-        node = self.buckets[index]
-        
-        while node is not None:
-            if node.key == key:
-                node.value += value
-                return
-            node = node.next
+        values = self.values
+        if key in values:
+            values[key] += value
+            return
         
-        new_node = Node(key, value)
-        new_node.next = self.buckets[index]
-        self.buckets[index] = new_node
+        values[key] = value
+        self.buckets[self.hash(key)].append(key)
         self.count += 1
     
     def remove(self, key: str) -> None:
-        index = self.hash(key)
-        node = self.buckets[index]
-        prev = None
-        
-        while node is not None:
-            if node.key == key:
-                if prev is None:
-                    self.buckets[index] = node.next
-                else:
-                    prev.next = node.next
-                self.count -= 1
-                return
-            prev = node
-            node = node.next
+        values = self.values
+        if key in values:
+            del values[key]
+            self.buckets[self.hash(key)].remove(key)
+            self.count -= 1
     
     def increase(self, key: str) -> None:
-        index = self.hash(key)
-        node = self.buckets[index]
-        
-        while node is not None:
-            if node.key == key:
-                node.value += 1
-                return
-            node = node.next
+        values = self.values
+        if key in values:
+            values[key] += 1
+    
+    def increase_and_get(self, key: str) -> int:
+        values = self.values
+        value = values.get(key)
+        if value is None:
+            return 0
+        value += 1
+        values[key] = value
+        return value
     
     def find(self, key: str) -> int:
-        index = self.hash(key)
-        node = self.buckets[index]
-        
-        while node is not None:
-            if node.key == key:
-                return node.value
-            node = node.next
-        
-        return 0
+        return self.values.get(key, 0)
     
     def output_to_file(self, filename: str) -> None:
         try:
+            values = self.values
+            lines = [f"{key} : {values[key]}\n"
+                     for bucket in self.buckets for key in bucket]
             with open(filename, 'w') as outfile:
-                for i in range(self.maxhash):
-                    node = self.buckets[i]
-                    while node is not None:
-                        outfile.write(f"{node.key} : {node.value}\n")
-                        node = node.next
+                outfile.write("".join(lines))
         except IOError as e:
             print(f"Error: could not open file {filename}: {e}")
     
     def get_bucket_sizes(self) -> list:
-        bucket_sizes = []
-        for i in range(self.maxhash):
-            collision_count = 0
-            node = self.buckets[i]
-            while node is not None:
-                collision_count += 1
-                node = node.next
-            bucket_sizes.append((i, collision_count))
-        return bucket_sizes
+        return list(enumerate(map(len, self.buckets)))
+    
+    def stats(self, bucket_sizes: list | None = None) -> tuple:
+        # Bucket sizes -> (total, non_empty, mean, variance), summed in C.
+        # Sizes are ints, so exact sums of x and x^2 give the variance directly.
+        # Pass get_bucket_sizes()'s pairs to reuse them instead of re-measuring.
+        if bucket_sizes is None:
+            sizes = list(map(len, self.buckets))
+        else:
+            sizes = list(map(itemgetter(1), bucket_sizes))
+        total = sum(sizes)
+        sq_sum = sum(map(mul, sizes, sizes))
+        non_empty = len(sizes) - sizes.count(0)
+        
+        n = self.maxhash
+        return total, non_empty, total / n, (n * sq_sum - total * total) / (n * n)
 
 
 def analyze_hash_table(hash_table: HashTable, maxhash_value: int) -> None:
@@ -136,28 +107,22 @@ def analyze_hash_table(hash_table: HashTable, maxhash_value: int) -> None:
     print("="*60)
     
     print(f"\nOperations Test:")
-    print(f"  Count of 'Alice': {hash_table.find('Alice')}")
     original_alice_count = hash_table.find('Alice')
-    hash_table.increase("Alice")
-    print(f"  Count of 'Alice' after increase: {hash_table.find('Alice')}")
+    print(f"  Count of 'Alice': {original_alice_count}")
+    print(f"  Count of 'Alice' after increase: {hash_table.increase_and_get('Alice')}")
     if original_alice_count > 0:
         hash_table.insert("Alice", -1)
     
     print("\n\nBucket Statistics (Hash no : No of collisions):")
     print("-" * 50)
     bucket_sizes = hash_table.get_bucket_sizes()
-    total_sum = 0
-    non_empty_buckets = 0
     
     for hash_no, size in bucket_sizes:
         if size > 0:
             print(f"  {hash_no} : {size}")
-            total_sum += size
-            non_empty_buckets += 1
     
     num_buckets = len(bucket_sizes)
-    mean = total_sum / num_buckets
-    variance = variance_calc(total_sum, num_buckets, bucket_sizes)
+    total_sum, non_empty_buckets, mean, variance = hash_table.stats(bucket_sizes)
     std_dev = math.sqrt(variance)
     
     print("\n\nStatistical Analysis:")
@@ -168,9 +133,8 @@ def analyze_hash_table(hash_table: HashTable, maxhash_value: int) -> None:
     print(f"  Variance: {variance:.4f}")
     print(f"  Standard Deviation: {std_dev:.4f}")
     
-    bucket_sizes_sorted = sorted(bucket_sizes, key=lambda x: x[1], reverse=True)
-    
     top_10_percent = max(1, num_buckets // 10)
+    bucket_sizes_sorted = heapq.nlargest(top_10_percent, bucket_sizes, key=itemgetter(1))
     print(f"\n\nTop 10% Buckets by Collision Count:")
     print("-" * 50)
     print("  Hash no : No of collisions")
@@ -192,10 +156,10 @@ def load_words_from_file(hash_table: HashTable, filename: Path) -> bool:
     """
     try:
         with open(filename, 'r') as in_file:
-            for line in in_file:
-                words = line.split()
-                for word in words:
-                    hash_table.insert(word, 1)
+            word_counts = Counter(in_file.read().split())
+        # Insert each distinct word once with its total count
+        for word, count in word_counts.items():
+            hash_table.insert(word, count)
         return True
     except FileNotFoundError:
         print(f"✗ Error: File '{filename}' not found")
@@ -3,23 +3,10 @@ hash_table.py
 Hash Table implementation with chaining for collision resolution
 """
 
-MAXHASH = 2999
-
+import sys
+from operator import mul
 
-class Node:
-    """Node class for linked list in hash table bucket"""
-    
-    def __init__(self, key: str, value: int):
-        """
-        Initialize a node with a key-value pair
-        
-        Args:
-            key: String key for the hash table
-            value: Integer value associated with the key
-        """
-        self.key = key
-        self.value = value
-        self.next = None
+MAXHASH = 2999
 
 
 class HashTable:
@@ -28,8 +15,10 @@ class HashTable:
     def __init__(self, maxhash: int = MAXHASH):
         """Initialize hash table with empty buckets"""
         self.maxhash = maxhash
-        self.buckets = [None] * self.maxhash
+        self.buckets = [[] for _ in range(self.maxhash)]  # Keys, grouped by hash
+        self.values = {}  # Key -> value; lookups and updates go through this dict
         self.count = 0
+        self._pow31 = [1 % self.maxhash]  # 31**i mod maxhash, grown on demand
     
     def hash(self, key: str) -> int:
         """
@@ -41,10 +30,22 @@ class HashTable:
         Returns:
             Hash value (index in buckets array)
         """
-        hash_value = 0
-        for char in key:
-            hash_value = hash_value * 31 + ord(char)
-        return hash_value % self.maxhash
+        pow31 = self._pow31
+        if len(key) > len(pow31):
+            self._extend_powers(len(key))
+        # sum(ord(c) * 31**i) over the reversed key, with the loop run in C
+        return sum(map(mul, map(ord, reversed(key)), pow31)) % self.maxhash
+    
+    def _extend_powers(self, length: int) -> None:
+        """
+        Grow the table of powers of 31 (mod maxhash) to cover a key length
+        
+        Args:
+            length: Length of the longest key to be hashed
+        """
+        pow31 = self._pow31
+        while len(pow31) < length:
+            pow31.append(pow31[-1] * 31 % self.maxhash)
     
     def insert(self, key: str, value: int) -> None:
         """
@@ -55,18 +56,13 @@ class HashTable:
             key: String key to insert
             value: Integer value to insert
         """
-        index = self.hash(key)
-        node = self.buckets[index]
-        
-        while node is not None:
-            if node.key == key:
-                node.value += value
-                return
-            node = node.next
+        values = self.values
+        if key in values:
+            values[key] += value
+            return
         
-        new_node = Node(key, value)
-        new_node.next = self.buckets[index]
-        self.buckets[index] = new_node
+        values[key] = value
+        self.buckets[self.hash(key)].append(key)
         self.count += 1
     
     def remove(self, key: str) -> None:
@@ -76,20 +72,11 @@ class HashTable:
         Args:
             key: String key to remove
         """
-        index = self.hash(key)
-        node = self.buckets[index]
-        prev = None
-        
-        while node is not None:
-            if node.key == key:
-                if prev is None:
-                    self.buckets[index] = node.next
-                else:
-                    prev.next = node.next
-                self.count -= 1
-                return
-            prev = node
-            node = node.next
+        values = self.values
+        if key in values:
+            del values[key]
+            self.buckets[self.hash(key)].remove(key)
+            self.count -= 1
     
     def increase(self, key: str) -> None:
         """
@@ -98,14 +85,27 @@ class HashTable:
         Args:
             key: String key to increment
         """
-        index = self.hash(key)
-        node = self.buckets[index]
+        values = self.values
+        if key in values:
+            values[key] += 1
+    
+    def increase_and_get(self, key: str) -> int:
+        """
+        Increment the value associated with a key by 1 and return it
         
-        while node is not None:
-            if node.key == key:
-                node.value += 1
-                return
-            node = node.next
+        Args:
+            key: String key to increment
+            
+        Returns:
+            New value if key exists, 0 otherwise
+        """
+        values = self.values
+        value = values.get(key)
+        if value is None:
+            return 0
+        value += 1
+        values[key] = value
+        return value
     
     def find(self, key: str) -> int:
         """
@@ -117,23 +117,13 @@ class HashTable:
         Returns:
             Value if key exists, 0 otherwise
         """
-        index = self.hash(key)
-        node = self.buckets[index]
-        
-        while node is not None:
-            if node.key == key:
-                return node.value
-            node = node.next
-        
-        return 0
+        return self.values.get(key, 0)
     
     def list_all_keys(self) -> None:
         """Print all key-value pairs in the hash table"""
-        for i in range(self.maxhash):
-            node = self.buckets[i]
-            while node is not None:
-                print(f"{node.key} : {node.value}")
-                node = node.next
+        values = self.values
+        sys.stdout.write("".join(f"{key} : {values[key]}\n"
+                                 for bucket in self.buckets for key in bucket))
     
     def output_to_file(self, filename: str) -> None:
         """
@@ -143,12 +133,11 @@ class HashTable:
             filename: Name of output file
         """
         try:
+            values = self.values
+            lines = [f"{key} : {values[key]}\n"
+                     for bucket in self.buckets for key in bucket]
             with open(filename, 'w') as outfile:
-                for i in range(self.maxhash):
-                    node = self.buckets[i]
-                    while node is not None:
-                        outfile.write(f"{node.key} : {node.value}\n")
-                        node = node.next
+                outfile.write("".join(lines))
         except IOError as e:
             print(f"Error: could not open file {filename}: {e}")
     
@@ -161,19 +150,19 @@ class HashTable:
         """
         return self.count
     
-    def get_bucket(self, index: int) -> Node:
+    def get_bucket(self, index: int) -> list:
         """
-        Get the head node of a bucket
+        Get the entries of a bucket
         
         Args:
             index: Bucket index
             
         Returns:
-            Head node of the bucket or None
+            List of (key, value) tuples in the bucket, or None if out of range
         """
         if index < 0 or index >= self.maxhash:
             return None
-        return self.buckets[index]
+        return [(key, self.values[key]) for key in self.buckets[index]]
     
     def get_bucket_sizes(self) -> list:
         """
@@ -182,12 +171,4 @@ class HashTable:
         Returns:
             List of tuples (bucket_index, collision_count)
         """
-        bucket_sizes = []
-        for i in range(self.maxhash):
-            collision_count = 0
-            node = self.buckets[i]
-            while node is not None:
-                collision_count += 1
-                node = node.next
-            bucket_sizes.append((i, collision_count))
-        return bucket_sizes
\ No newline at end of file
+        return list(enumerate(map(len, self.buckets)))
\ No newline at end of file
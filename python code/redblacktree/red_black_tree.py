@@ -1,15 +1,15 @@
-from enum import Enum
+import sys
 
-
-class Color(Enum):
-    """Enum for node colors"""
-    RED = 0
-    BLACK = 1
+# Node colors (plain ints compare faster than Enum members)
+RED = 0
+BLACK = 1
 
 
 class Node:
     """Node class for Red-Black Tree"""
     
+    __slots__ = ('key', 'color', 'left', 'right')
+    
     def __init__(self, key: int):
         """
         Initialize a node
@@ -18,10 +18,9 @@ class Node:
             key: Integer key value for the node
         """
         self.key = key
-        self.color = Color.RED
+        self.color = RED
         self.left = None
         self.right = None
-        self.parent = None
 
 
 class RedBlackTree:
@@ -30,62 +29,82 @@ class RedBlackTree:
     def __init__(self):
         """Initialize empty Red-Black Tree"""
         self.root = None
+        self._free = []  # Nodes unlinked by delete(), reused by insert()
+    
+    def _alloc(self, key: int) -> Node:
+        """
+        Get a fresh red node for a key, reusing a pooled node if there is one
+        
+        Args:
+            key: Key for the node
+            
+        Returns:
+            Unlinked red node holding key
+        """
+        if self._free:
+            node = self._free.pop()
+            node.key = key
+            node.color = RED
+            return node
+        return Node(key)
+    
+    def _release(self, node: Node) -> None:
+        """
+        Clear an unlinked node's links and return it to the pool
+        
+        Args:
+            node: Node that is no longer part of the tree
+        """
+        node.left = node.right = None
+        self._free.append(node)
     
-    def left_rotate(self, x: Node) -> None:
+    def _replace_child(self, parent: Node, old: Node, new: Node) -> None:
+        """
+        Point the link that held old (a child of parent, or the root) at new
+        
+        Args:
+            parent: Parent of old, or None if old is the root
+            old: Current child
+            new: Replacement child
+        """
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+    
+    def left_rotate(self, x: Node, parent: Node) -> None:
         """
         Perform left rotation on node x
         
         Args:
             x: Node to rotate
+            parent: Parent of x, or None if x is the root
         """
         if x is None or x.right is None:
             return
             
         y = x.right
         x.right = y.left
-        
-        if y.left is not None:
-            y.left.parent = x
-        
-        y.parent = x.parent
-        
-        if x.parent is None:
-            self.root = y
-        elif x == x.parent.left:
-            x.parent.left = y
-        else:
-            x.parent.right = y
-        
         y.left = x
-        x.parent = y
+        self._replace_child(parent, x, y)
     
-    def right_rotate(self, y: Node) -> None:
+    def right_rotate(self, y: Node, parent: Node) -> None:
         """
         Perform right rotation on node y
         
         Args:
             y: Node to rotate
+            parent: Parent of y, or None if y is the root
         """
         if y is None or y.left is None:
             return
             
         x = y.left
         y.left = x.right
-        
-        if x.right is not None:
-            x.right.parent = y
-        
-        x.parent = y.parent
-        
-        if y.parent is None:
-            self.root = x
-        elif y == y.parent.left:
-            y.parent.left = x
-        else:
-            y.parent.right = x
-        
         x.right = y
-        y.parent = x
+        self._replace_child(parent, y, x)
     
     def insert(self, key: int) -> None:
         """
@@ -94,269 +113,184 @@ class RedBlackTree:
         Args:
             key: Key to insert
         """
-        z = Node(key)
+        z = self._alloc(key)
         
-        y = None
+        # Nodes carry no parent pointers, so remember the way down
+        path = []
         x = self.root
         
         while x is not None:
-            y = x
-            if z.key < x.key:
-                x = x.left
-            else:
-                x = x.right
+            path.append(x)
+            x = x.left if key < x.key else x.right
         
-        z.parent = y
-        
-        if y is None:
+        if not path:
             self.root = z
-        elif z.key < y.key:
-            y.left = z
         else:
-            y.right = z
+            y = path[-1]
+            if key < y.key:
+                y.left = z
+            else:
+                y.right = z
         
-        self.fix_insert(z)
+        self.fix_insert(z, path)
     
-    def fix_insert(self, z: Node) -> None:
+    def fix_insert(self, z: Node, path: list) -> None:
         """
         Fix Red-Black Tree properties after insertion
         
         Args:
             z: Newly inserted node
+            path: Ancestors of z from the root down; consumed by the fix-up
         """
-        while z != self.root and z.parent is not None and z.parent.color == Color.RED:
-            if z.parent.parent is None:
+        while len(path) > 1:
+            p = path.pop()
+            if p.color != RED:
                 break
-                
-            if z.parent == z.parent.parent.left:
-                y = z.parent.parent.right
-                if y is not None and y.color == Color.RED:
-                    z.parent.color = Color.BLACK
-                    y.color = Color.BLACK
-                    z.parent.parent.color = Color.RED
-                    z = z.parent.parent
-                else:
-                    if z == z.parent.right:
-                        z = z.parent
-                        self.left_rotate(z)
-                    if z.parent is not None and z.parent.parent is not None:
-                        z.parent.color = Color.BLACK
-                        z.parent.parent.color = Color.RED
-                        self.right_rotate(z.parent.parent)
+            g = path.pop()
+            
+            if p is g.left:
+                y = g.right
+                if y is not None and y.color == RED:
+                    p.color = BLACK
+                    y.color = BLACK
+                    g.color = RED
+                    z = g
+                    continue
+                if z is p.right:
+                    self.left_rotate(p, g)
+                    p = z
+                p.color = BLACK
+                g.color = RED
+                self.right_rotate(g, path[-1] if path else None)
             else:
-                y = z.parent.parent.left
-                if y is not None and y.color == Color.RED:
-                    z.parent.color = Color.BLACK
-                    y.color = Color.BLACK
-                    z.parent.parent.color = Color.RED
-                    z = z.parent.parent
-                else:
-                    if z == z.parent.left:
-                        z = z.parent
-                        self.right_rotate(z)
-                    if z.parent is not None and z.parent.parent is not None:
-                        z.parent.color = Color.BLACK
-                        z.parent.parent.color = Color.RED
-                        self.left_rotate(z.parent.parent)
+                y = g.left
+                if y is not None and y.color == RED:
+                    p.color = BLACK
+                    y.color = BLACK
+                    g.color = RED
+                    z = g
+                    continue
+                if z is p.left:
+                    self.right_rotate(p, g)
+                    p = z
+                p.color = BLACK
+                g.color = RED
+                self.left_rotate(g, path[-1] if path else None)
+            break
         
         if self.root is not None:
-            self.root.color = Color.BLACK
+            self.root.color = BLACK
     
-    def delete(self, key: int) -> None:
+    def delete(self, key: int) -> bool:
         """
         Delete a key from the tree
         
         Args:
             key: Key to delete
+            
+        Returns:
+            True if the key was found and deleted, False otherwise
         """
-        z = self.search(key)
+        path = []
+        z = self.root
+        while z is not None and z.key != key:
+            path.append(z)
+            z = z.left if key < z.key else z.right
         if z is None:
-            return
-        
-        y = None
-        x = None
-        x_parent = None
+            return False
         
+        # y is the node actually spliced out: z itself, or its successor
         if z.left is None or z.right is None:
             y = z
         else:
-            y = self.successor(z)
+            path.append(z)
+            y = z.right
+            while y.left is not None:
+                path.append(y)
+                y = y.left
         
-        if y.left is not None:
-            x = y.left
-        else:
-            x = y.right
-        
-        if x is not None:
-            x.parent = y.parent
-        else:
-            x_parent = y.parent
-        
-        if y.parent is None:
-            self.root = x
-        elif y == y.parent.left:
-            y.parent.left = x
-        else:
-            y.parent.right = x
+        x = y.left if y.left is not None else y.right
+        self._replace_child(path[-1] if path else None, y, x)
         
-        if y != z:
+        if y is not z:
             z.key = y.key
         
-        if y.color == Color.BLACK:
-            if x is not None:
-                self.fix_delete(x)
-            elif x_parent is not None:
-                self.fix_delete_null(x_parent)
+        if y.color == BLACK:
+            self.fix_delete(x, path)
+        
+        self._release(y)
+        return True
     
-    def remove(self, key: int) -> None:
+    def remove(self, key: int) -> bool:
         """Alias for delete() method for compatibility with tests"""
-        self.delete(key)
+        return self.delete(key)
     
-    def fix_delete(self, x: Node) -> None:
+    def fix_delete(self, x: Node, path: list) -> None:
         """
         Fix Red-Black Tree properties after deletion
         
         Args:
-            x: Node where fixing starts
-        """
-        while x is not None and x != self.root and x.color == Color.BLACK:
-            if x.parent is None:
-                break
-                
-            if x == x.parent.left:
-                w = x.parent.right
-                if w is None:
-                    break
-                if w.color == Color.RED:
-                    w.color = Color.BLACK
-                    x.parent.color = Color.RED
-                    self.left_rotate(x.parent)
-                    w = x.parent.right
-                if w is None:
-                    break
-                if (w.left is None or w.left.color == Color.BLACK) and \
-                   (w.right is None or w.right.color == Color.BLACK):
-                    w.color = Color.RED
-                    x = x.parent
+            x: Node where fixing starts (None for an empty leaf position)
+            path: Ancestors of x's position from the root down; consumed by the fix-up
+        """
+        while path and (x is None or x.color == BLACK):
+            xp = path[-1]
+            # x may be None, but its sibling cannot be: x's side is one black short
+            if x is xp.left:
+                w = xp.right
+                if w.color == RED:
+                    w.color = BLACK
+                    xp.color = RED
+                    self.left_rotate(xp, path[-2] if len(path) > 1 else None)
+                    path.insert(-1, w)
+                    w = xp.right
+                wl = w.left
+                wr = w.right
+                if (wl is None or wl.color == BLACK) and \
+                   (wr is None or wr.color == BLACK):
+                    w.color = RED
+                    x = path.pop()
                 else:
-                    if w.right is None or w.right.color == Color.BLACK:
-                        if w.left is not None:
-                            w.left.color = Color.BLACK
-                        w.color = Color.RED
-                        self.right_rotate(w)
-                        w = x.parent.right
-                    if w is not None:
-                        if w.right is not None:
-                            w.right.color = Color.BLACK
-                        w.color = x.parent.color
-                        x.parent.color = Color.BLACK
-                        self.left_rotate(x.parent)
+                    if wr is None or wr.color == BLACK:
+                        wl.color = BLACK
+                        w.color = RED
+                        self.right_rotate(w, xp)
+                        w = xp.right
+                    w.color = xp.color
+                    xp.color = BLACK
+                    w.right.color = BLACK
+                    self.left_rotate(xp, path[-2] if len(path) > 1 else None)
                     x = self.root
-            else:
-                w = x.parent.left
-                if w is None:
                     break
-                if w.color == Color.RED:
-                    w.color = Color.BLACK
-                    x.parent.color = Color.RED
-                    self.right_rotate(x.parent)
-                    w = x.parent.left
-                if w is None:
-                    break
-                if (w.right is None or w.right.color == Color.BLACK) and \
-                   (w.left is None or w.left.color == Color.BLACK):
-                    w.color = Color.RED
-                    x = x.parent
+            else:
+                w = xp.left
+                if w.color == RED:
+                    w.color = BLACK
+                    xp.color = RED
+                    self.right_rotate(xp, path[-2] if len(path) > 1 else None)
+                    path.insert(-1, w)
+                    w = xp.left
+                wl = w.left
+                wr = w.right
+                if (wr is None or wr.color == BLACK) and \
+                   (wl is None or wl.color == BLACK):
+                    w.color = RED
+                    x = path.pop()
                 else:
-                    if w.left is None or w.left.color == Color.BLACK:
-                        if w.right is not None:
-                            w.right.color = Color.BLACK
-                        w.color = Color.RED
-                        self.left_rotate(w)
-                        w = x.parent.left
-                    if w is not None:
-                        if w.left is not None:
-                            w.left.color = Color.BLACK
-                        w.color = x.parent.color
-                        x.parent.color = Color.BLACK
-                        self.right_rotate(x.parent)
+                    if wl is None or wl.color == BLACK:
+                        wr.color = BLACK
+                        w.color = RED
+                        self.left_rotate(w, xp)
+                        w = xp.left
+                    w.color = xp.color
+                    xp.color = BLACK
+                    w.left.color = BLACK
+                    self.right_rotate(xp, path[-2] if len(path) > 1 else None)
                     x = self.root
+                    break
         
         if x is not None:
-            x.color = Color.BLACK
-    
-    def fix_delete_null(self, parent: Node) -> None:
-        """
-        Fix Red-Black Tree properties when deleting a node with null child
-        
-        Args:
-            parent: Parent of the deleted node
-        """
-        x = None
-        while parent is not None and parent != self.root:
-            if parent.parent is None:
-                break
-                
-            if parent == parent.parent.left:
-                w = parent.parent.right
-                if w is None:
-                    break
-                if w.color == Color.RED:
-                    w.color = Color.BLACK
-                    parent.parent.color = Color.RED
-                    self.left_rotate(parent.parent)
-                    w = parent.parent.right
-                if w is None:
-                    break
-                if (w.left is None or w.left.color == Color.BLACK) and \
-                   (w.right is None or w.right.color == Color.BLACK):
-                    w.color = Color.RED
-                    parent = parent.parent
-                else:
-                    if w.right is None or w.right.color == Color.BLACK:
-                        if w.left is not None:
-                            w.left.color = Color.BLACK
-                        w.color = Color.RED
-                        self.right_rotate(w)
-                        if parent.parent is not None:
-                            w = parent.parent.right
-                    if w is not None and parent.parent is not None:
-                        if w.right is not None:
-                            w.right.color = Color.BLACK
-                        w.color = parent.parent.color
-                        parent.parent.color = Color.BLACK
-                        self.left_rotate(parent.parent)
-                    break
-            else:
-                w = parent.parent.left
-                if w is None:
-                    break
-                if w.color == Color.RED:
-                    w.color = Color.BLACK
-                    parent.parent.color = Color.RED
-                    self.right_rotate(parent.parent)
-                    w = parent.parent.left
-                if w is None:
-                    break
-                if (w.right is None or w.right.color == Color.BLACK) and \
-                   (w.left is None or w.left.color == Color.BLACK):
-                    w.color = Color.RED
-                    parent = parent.parent
-                else:
-                    if w.left is None or w.left.color == Color.BLACK:
-                        if w.right is not None:
-                            w.right.color = Color.BLACK
-                        w.color = Color.RED
-                        self.left_rotate(w)
-                        if parent.parent is not None:
-                            w = parent.parent.left
-                    if w is not None and parent.parent is not None:
-                        if w.left is not None:
-                            w.left.color = Color.BLACK
-                        w.color = parent.parent.color
-                        parent.parent.color = Color.BLACK
-                        self.right_rotate(parent.parent)
-                    break
+            x.color = BLACK
     
     def search(self, key: int) -> Node:
         """
@@ -369,12 +303,12 @@ class RedBlackTree:
             Node with the key or None if not found
         """
         temp = self.root
-        while temp is not None and temp.key != key:
-            if key < temp.key:
-                temp = temp.left
-            else:
-                temp = temp.right
-        return temp
+        while temp is not None:
+            temp_key = temp.key
+            if key == temp_key:
+                return temp
+            temp = temp.left if key < temp_key else temp.right
+        return None
     
     def find_min(self, node: Node) -> Node:
         """
@@ -422,10 +356,27 @@ class RedBlackTree:
         """
         if x is None:
             return -1
-        else:
-            left_height = self.get_height(x.left)
-            right_height = self.get_height(x.right)
-            return max(left_height, right_height) + 1
+        
+        # Depth-first walk with an explicit stack of (node, depth) pairs
+        height = 0
+        stack = [(x, 0)]
+        append = stack.append
+        pop = stack.pop
+        while stack:
+            node, depth = pop()
+            left = node.left
+            right = node.right
+            if left is None and right is None:
+                # Only leaves can end a longest path
+                if depth > height:
+                    height = depth
+                continue
+            depth += 1
+            if left is not None:
+                append((left, depth))
+            if right is not None:
+                append((right, depth))
+        return height
     
     def find_min_value(self) -> None:
         """Print minimum value in tree"""
@@ -477,12 +428,16 @@ class RedBlackTree:
             return None
         if node.right is not None:
             return self.find_min(node.right)
-        else:
-            y = node.parent
-            while y is not None and node == y.right:
-                node = y
-                y = y.parent
-            return y
+        
+        # Without parent pointers, find the way down from the root instead:
+        # the successor is the last ancestor whose left subtree holds node
+        succ = None
+        path = self._path_to(node)
+        for i, ancestor in enumerate(path):
+            below = path[i + 1] if i + 1 < len(path) else node
+            if ancestor.left is below:
+                succ = ancestor
+        return succ
     
     def predecessor(self, node: Node) -> Node:
         """
@@ -499,11 +454,43 @@ class RedBlackTree:
         if node.left is not None:
             return self.find_max(node.left)
         
-        temp = node.parent
-        while temp is not None and node == temp.left:
-            node = temp
-            temp = temp.parent
-        return temp
+        # The predecessor is the last ancestor whose right subtree holds node
+        pred = None
+        path = self._path_to(node)
+        for i, ancestor in enumerate(path):
+            below = path[i + 1] if i + 1 < len(path) else node
+            if ancestor.right is below:
+                pred = ancestor
+        return pred
+    
+    def _path_to(self, node: Node) -> list:
+        """
+        Ancestors of node, root first, matching node by identity
+        
+        Duplicate keys can end up on either side of an equal key after
+        rotations, so on a tie both subtrees are searched.
+        
+        Args:
+            node: Node to locate
+            
+        Returns:
+            List of ancestors (empty for the root or a node not in the tree)
+        """
+        key = node.key
+        path = []
+        stack = [(self.root, 0)] if self.root is not None else []
+        while stack:
+            temp, depth = stack.pop()
+            del path[depth:]
+            if temp is node:
+                return path
+            path.append(temp)
+            depth += 1
+            if key <= temp.key and temp.left is not None:
+                stack.append((temp.left, depth))
+            if key >= temp.key and temp.right is not None:
+                stack.append((temp.right, depth))
+        return []
     
     def find_successor(self, key: int) -> None:
         """
@@ -543,78 +530,95 @@ class RedBlackTree:
         """Print tree in sorted (in-order) manner"""
         self.in_order_traversal(self.root)
     
-    def in_order_traversal(self, node: Node) -> None:
+    def in_order_traversal(self, node: Node, out: list | None = None) -> None:
         """
         In-order traversal of tree
         
         Args:
             node: Current node
-        """
-        if node is None:
-            return
-        
-        self.in_order_traversal(node.left)
-        color_str = "Red" if node.color == Color.RED else "Black"
-        print(f"( {node.key} , {color_str} )")
-        self.in_order_traversal(node.right)
+            out: List to collect output lines in; printed at once when omitted
+        """
+        lines = [] if out is None else out
+        stack = []
+        while stack or node is not None:
+            # Walk left as far as possible, then visit and turn right
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            color_str = "Red" if node.color == RED else "Black"
+            lines.append(f"( {node.key} , {color_str} )\n")
+            node = node.right
+        
+        if out is None:
+            sys.stdout.write("".join(lines))
     
     def print_tree(self) -> None:
         """Print tree structure in a visual format"""
         if self.root is None:
             print("Tree is empty")
             return
-        print("\n" + "="*60)
-        print("TREE STRUCTURE:")
-        print("="*60)
-        self._print_tree_helper(self.root, "", True)
-        print("="*60 + "\n")
+        out = ["", "="*60, "TREE STRUCTURE:", "="*60]
+        self._print_tree_helper(self.root, "", True, out)
+        out.append("="*60 + "\n")
+        sys.stdout.write("\n".join(out) + "\n")
     
-    def _print_tree_helper(self, node: Node, prefix: str, is_tail: bool) -> None:
+    def _print_tree_helper(self, node: Node, prefix: str, is_tail: bool, out: list) -> None:
         """
-        Helper function to print tree structure recursively
+        Helper function to collect the tree structure lines
         
         Args:
             node: Current node
             prefix: Prefix for indentation
             is_tail: Whether this is the last child
+            out: List the output lines are appended to
         """
         if node is None:
             return
         
-        color_indicator = "🔴" if node.color == Color.RED else "⚫"
-        
-        print(prefix + ("└── " if is_tail else "├── ") + f"{color_indicator} {node.key}")
-        
-        has_left = node.left is not None
-        has_right = node.right is not None
-        
-        extension = "    " if is_tail else "│   "
-        
-        if has_left:
-            self._print_tree_helper(node.left, prefix + extension, not has_right)
-        if has_right:
-            self._print_tree_helper(node.right, prefix + extension, True)
+        stack = [(node, prefix, is_tail)]
+        while stack:
+            node, prefix, is_tail = stack.pop()
+            
+            color_indicator = "🔴" if node.color == RED else "⚫"
+            
+            out.append(prefix + ("└── " if is_tail else "├── ") + f"{color_indicator} {node.key}")
+            
+            has_left = node.left is not None
+            has_right = node.right is not None
+            
+            extension = "    " if is_tail else "│   "
+            
+            # Push right first so the left subtree is printed first
+            if has_right:
+                stack.append((node.right, prefix + extension, True))
+            if has_left:
+                stack.append((node.left, prefix + extension, not has_right))
     
     def print_tree_compact(self) -> None:
         """Print tree structure in a more compact format"""
         if self.root is None:
             print("Tree is empty")
             return
-        print("\nTree (In-Order): ", end="")
-        self._compact_helper(self.root)
-        print()
+        out = ["\nTree (In-Order): "]
+        self._compact_helper(self.root, out)
+        out.append("\n")
+        sys.stdout.write("".join(out))
     
-    def _compact_helper(self, node: Node) -> None:
+    def _compact_helper(self, node: Node, out: list) -> None:
         """
-        Helper function to print tree in compact format
+        Helper function to collect the tree in compact format
         
         Args:
             node: Current node
-        """
-        if node is None:
-            return
-        
-        self._compact_helper(node.left)
-        color_char = "R" if node.color == Color.RED else "B"
-        print(f"({node.key}{color_char}) ", end="")
-        self._compact_helper(node.right)
\ No newline at end of file
+            out: List the output pieces are appended to
+        """
+        stack = []
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            color_char = "R" if node.color == RED else "B"
+            out.append(f"({node.key}{color_char}) ")
+            node = node.right
\ No newline at end of file
@@ -0,0 +1,110 @@
+import random
+import unittest
+
+from red_black_tree import RED, BLACK, RedBlackTree
+
+
+def check_tree(tree: RedBlackTree) -> list:
+    """Assert the red-black invariants and return the keys in order.
+    Checks ordering, a black root, no red node with a red child and equal
+    black height on every root-to-leaf path."""
+    keys = []
+
+    def walk(node, lo, hi) -> int:
+        if node is None:
+            return 1
+        assert lo is None or node.key >= lo, f"{node.key} out of order"
+        assert hi is None or node.key <= hi, f"{node.key} out of order"
+        assert node.color in (RED, BLACK)
+        if node.color == RED:
+            for child in (node.left, node.right):
+                assert child is None or child.color == BLACK, f"red-red edge at {node.key}"
+        left = walk(node.left, lo, node.key)
+        keys.append(node.key)
+        right = walk(node.right, node.key, hi)
+        assert left == right, f"black height differs under {node.key}"
+        return left + (node.color == BLACK)
+
+    assert tree.root is None or tree.root.color == BLACK, "root is red"
+    walk(tree.root, None, None)
+    return keys
+
+
+class TestRedBlackTreeDelete(unittest.TestCase):
+    def test_mixed_inserts_and_deletes_keep_invariants(self):
+        # Regression: the old fix_delete_null fix-up broke the invariants in
+        # most of these runs
+        for seed in range(300):
+            with self.subTest(seed=seed):
+                rnd = random.Random(seed)
+                tree = RedBlackTree()
+                present = []
+                for _ in range(150):
+                    if present and rnd.random() < 0.45:
+                        key = rnd.choice(present) if rnd.random() < 0.8 else rnd.randint(0, 60)
+                        self.assertEqual(tree.delete(key), key in present)
+                        if key in present:
+                            present.remove(key)
+                    else:
+                        key = rnd.randint(0, 60)
+                        tree.insert(key)
+                        present.append(key)
+                    self.assertEqual(check_tree(tree), sorted(present))
+
+    def test_delete_everything(self):
+        tree = RedBlackTree()
+        keys = list(range(100))
+        random.Random(1).shuffle(keys)
+        for key in keys:
+            tree.insert(key)
+        random.Random(2).shuffle(keys)
+        for i, key in enumerate(keys):
+            self.assertTrue(tree.delete(key))
+            self.assertEqual(check_tree(tree), sorted(keys[i + 1:]))
+        self.assertIsNone(tree.root)
+        self.assertFalse(tree.delete(0))
+
+
+def in_order_nodes(tree: RedBlackTree) -> list:
+    """Nodes of the tree in in-order sequence"""
+    nodes = []
+    stack = []
+    node = tree.root
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        nodes.append(node)
+        node = node.right
+    return nodes
+
+
+class TestRedBlackTreeNeighbours(unittest.TestCase):
+    def test_duplicate_keys(self):
+        # Rotations leave an equal key in the root's left subtree
+        tree = RedBlackTree()
+        for key in (5, 5, 5):
+            tree.insert(key)
+        self.assertIs(tree.successor(tree.root.left), tree.root)
+        self.assertIs(tree.predecessor(tree.root.right), tree.root)
+        self.assertIsNone(tree.predecessor(tree.root.left))
+        self.assertIsNone(tree.successor(tree.root.right))
+
+    def test_match_in_order_sequence(self):
+        for seed in range(100):
+            with self.subTest(seed=seed):
+                rnd = random.Random(seed)
+                tree = RedBlackTree()
+                for _ in range(60):
+                    tree.insert(rnd.randint(0, 8))
+                for _ in range(20):
+                    tree.delete(rnd.randint(0, 8))
+                nodes = in_order_nodes(tree)
+                for i, node in enumerate(nodes):
+                    self.assertIs(tree.successor(node), nodes[i + 1] if i + 1 < len(nodes) else None)
+                    self.assertIs(tree.predecessor(node), nodes[i - 1] if i else None)
+
+
+if __name__ == '__main__':
+    unittest.main()
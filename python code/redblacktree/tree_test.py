@@ -2,6 +2,79 @@ from pathlib import Path
 from red_black_tree import RedBlackTree
 
 
+def _do_insert(tree: RedBlackTree, args: list) -> None:
+    if len(args) > 1:
+        key = int(args[1])
+        tree.insert(key)
+        print(f"Inserted {key}")
+        tree.print_tree()
+    else:
+        print("Usage: insert <number>")
+
+
+def _do_delete(tree: RedBlackTree, args: list) -> None:
+    if len(args) > 1:
+        key = int(args[1])
+        if tree.remove(key):
+            print(f"Deleted {key}")
+            tree.print_tree()
+        else:
+            print(f"Key {key} not found in tree")
+    else:
+        print("Usage: delete <number>")
+
+
+def _do_sort(tree: RedBlackTree, args: list) -> None:
+    if tree.root is None:
+        print("\nTree is empty")
+    else:
+        print("\nIn-order traversal (sorted):")
+        tree.sort()
+
+
+def _do_search(tree: RedBlackTree, args: list) -> None:
+    if len(args) > 1:
+        key = int(args[1])
+        node = tree.search(key)
+        if node is not None:
+            print(f"\nNode with key {key} found")
+        else:
+            print(f"\nNode with key {key} does not exist")
+    else:
+        print("Usage: search <number>")
+
+
+def _do_successor(tree: RedBlackTree, args: list) -> None:
+    if len(args) > 1:
+        key = int(args[1])
+        tree.find_successor(key)
+    else:
+        print("Usage: successor <number>")
+
+
+def _do_predecessor(tree: RedBlackTree, args: list) -> None:
+    if len(args) > 1:
+        key = int(args[1])
+        tree.find_predecessor(key)
+    else:
+        print("Usage: predecessor <number>")
+
+
+# Command name -> handler(tree, args); "exit" is handled by the loop itself
+HANDLERS = {
+    "insert": _do_insert,
+    "delete": _do_delete,
+    "sort": _do_sort,
+    "search": _do_search,
+    "min": lambda tree, args: tree.find_min_value(),
+    "max": lambda tree, args: tree.find_max_value(),
+    "successor": _do_successor,
+    "predecessor": _do_predecessor,
+    "height": lambda tree, args: tree.print_height(),
+    "tree": lambda tree, args: tree.print_tree(),
+}
+
+
 def main():
     """Main function for interactive tree testing"""
     
@@ -11,10 +84,12 @@ def main():
     input_file = script_dir / "input.txt"
     
     try:
-        with open(input_file, 'r') as f:
+        # Parse raw bytes: skips text decoding, and int() accepts bytes tokens
+        with open(input_file, 'rb') as f:
             numbers = list(map(int, f.read().split()))
-            for x in numbers:
-                tree.insert(x)
+        insert = tree.insert
+        for x in numbers:
+            insert(x)
         print(f"Loaded {len(numbers)} values from input.txt")
         tree.print_tree()
         tree.print_height()
@@ -38,62 +113,10 @@ def main():
             if command == "exit":
                 print("Goodbye!")
                 break
-            elif command == "insert":
-                if len(command_input) > 1:
-                    key = int(command_input[1])
-                    tree.insert(key)
-                    print(f"Inserted {key}")
-                    tree.print_tree()
-                else:
-                    print("Usage: insert <number>")
-            elif command == "delete":
-                if len(command_input) > 1:
-                    key = int(command_input[1])
-                    node = tree.search(key)
-                    if node is not None:
-                        tree.remove(key)
-                        print(f"Deleted {key}")
-                        tree.print_tree()
-                    else:
-                        print(f"Key {key} not found in tree")
-                else:
-                    print("Usage: delete <number>")
-            elif command == "sort":
-                if tree.root is None:
-                    print("\nTree is empty")
-                else:
-                    print("\nIn-order traversal (sorted):")
-                    tree.sort()
-            elif command == "search":
-                if len(command_input) > 1:
-                    key = int(command_input[1])
-                    node = tree.search(key)
-                    if node is not None:
-                        print(f"\nNode with key {key} found")
-                    else:
-                        print(f"\nNode with key {key} does not exist")
-                else:
-                    print("Usage: search <number>")
-            elif command == "min":
-                tree.find_min_value()
-            elif command == "max":
-                tree.find_max_value()
-            elif command == "successor":
-                if len(command_input) > 1:
-                    key = int(command_input[1])
-                    tree.find_successor(key)
-                else:
-                    print("Usage: successor <number>")
-            elif command == "predecessor":
-                if len(command_input) > 1:
-                    key = int(command_input[1])
-                    tree.find_predecessor(key)
-                else:
-                    print("Usage: predecessor <number>")
-            elif command == "height":
-                tree.print_height()
-            elif command == "tree":
-                tree.print_tree()
+            
+            handler = HANDLERS.get(command)
+            if handler is not None:
+                handler(tree, command_input)
             else:
                 print("Invalid command! Try: insert, delete, sort, search, min, max, successor, predecessor, height, tree, exit")
         except ValueError:
@@ -1,157 +1,404 @@
+import math
 import random
+import sys
 from typing import Optional
 
+# Promotion probability per level. 1/e minimises the expected number of key
+# comparisons per search (Kirschenhofer et al.), and comparisons are the
+# expensive part here since each one is a Python-level operation.
+P = 1 / math.e
+_INV_LOG_P = 1 / math.log(P)
+# Tallest tower random_height() will hand out. At P = 1/e a height of 32 is
+# only reached with probability e**-32, so this only trims freak draws.
+MAX_LEVEL = 32
+
 
 class Node:
-    def __init__(self, key: int, is_head: bool = False):
+    # No up link: towers are only ever walked downwards, from the level where
+    # a search first lands on them
+    __slots__ = ('key', 'right', 'left', 'down', 'keynext')
+
+    # A class attribute rather than a slot: it never changes per node, so
+    # HeadNode overrides it instead of every node paying 8 bytes for a flag
+    isHead: bool = False
+
+    def __init__(self, key: int):
         self.key: int = key
-        self.isHead: bool = is_head
         self.right: Optional[Node] = None
         self.left: Optional[Node] = None
-        self.up: Optional[Node] = None
         self.down: Optional[Node] = None
+        # Key of self.right (inf when there is none), so a search can test
+        # whether to step right without loading the next node
+        self.keynext: float = math.inf
 
     def __repr__(self) -> str:
         return f"Head" if self.isHead else f"Node({self.key})"
 
 
+class HeadNode(Node):
+    """Left sentinel of a level"""
+    __slots__ = ()
+
+    isHead = True
+
+    def __init__(self):
+        super().__init__(0)
+
+
 class SkipList:
     def __init__(self):
-        self.head0 = Node(0, is_head=True)
+        self.head0 = self._create_head()
         self.headh = self.head0
         self.level = 0
-        random.seed()
+        self.size = 0  # Number of keys in the list
+        self._free = []  # Unlinked nodes from delete(), reused by _create_node()
+        # Last key that find() located exactly, and its bottom-level node
+        self._last_key: Optional[int] = None
+        self._last_node: Optional[Node] = None
+        # Private generator, seeded from system entropy; its bound random()
+        # is kept so each height draw is a single C call
+        self._random = random.Random().random
 
-    def flip_coin(self) -> bool:
-        return random.randint(0, 1) == 1
+    def random_height(self) -> int:
+        """Number of levels a new node is promoted by: geometric with promotion
+        probability P, sampled by inversion from a single uniform draw and
+        capped at MAX_LEVEL"""
+        # P(height >= k) = P**k, so height = floor(log(U) / log(P)) for U in (0, 1]
+        height = int(math.log(1.0 - self._random()) * _INV_LOG_P)
+        return height if height < MAX_LEVEL else MAX_LEVEL
 
-    def print_list(self) -> None:
+    def format_list(self) -> str:
+        """Current state of every level, top level first, as print_list shows it"""
+        lines = ["Skip list current state is:"]
         head = self.headh
         level = self.level
-        print("Skip list current state is:")
         while head is not None:
-            print(f"Level {level} :", end="")
+            keys = []
             tmp = head.right
-            while tmp is not None:
-                print(f" {tmp.key}", end="")
+            while tmp.right is not None:  # Stop at the tail sentinel
+                keys.append(f" {tmp.key}")
                 tmp = tmp.right
-            print()
+            lines.append(f"Level {level} :" + "".join(keys))
             head = head.down
             level -= 1
-        print()
+        lines.append("")
+        return "\n".join(lines) + "\n"
 
-    def find(self, key: int) -> Optional[Node]:
-        """Find a node with given key; if not found return the node after which insertion should happen at lowest level"""
-        print(f"Starting to search {key} ....")
+    def print_list(self, file=None) -> None:
+        """Write the current state to file (stdout by default) in one call"""
+        (sys.stdout if file is None else file).write(self.format_list())
+
+    def find(self, key: int, verbose: bool = False) -> Optional[Node]:
+        """Find a node with given key; if not found return the node after which insertion should happen at lowest level.
+        With verbose=True the search path is printed as it is walked."""
+        if verbose:
+            out = []
+            tmp = self._find_traced(key, out)
+            sys.stdout.write("".join(out))
+            return tmp
+
+        # Repeated lookups of the same key skip the descent entirely
+        if key == self._last_key:
+            return self._last_node
+
+        # Hot path: step right while the next key fits, otherwise drop a level
+        tmp = self.headh
+        while True:
+            while tmp.keynext <= key:
+                tmp = tmp.right
+            down = tmp.down
+            if down is None:
+                break
+            tmp = down
+
+        if tmp.key == key and not tmp.isHead:
+            self._last_key = key
+            self._last_node = tmp
+        return tmp
+
+    def _find_traced(self, key: int, out: list) -> Optional[Node]:
+        """find() that records every step of the search as lines in out"""
+        out.append(f"Starting to search {key} ....\n")
         tmp = self.headh
         
         while tmp is not None:
-            if tmp.right is not None and tmp.right.key <= key:
-                print("Go right")
+            if tmp.keynext <= key:
+                out.append("Go right\n")
                 tmp = tmp.right
             elif tmp.down is not None:
-                print("Go down")
+                out.append("Go down\n")
                 tmp = tmp.down
             else:
                 break
         
-        if tmp is not None and not tmp.isHead and tmp.key == key:
-            print("Found the key")
-            return tmp
-        else:
-            print("Not found.")
-            return tmp
+        found = tmp is not None and not tmp.isHead and tmp.key == key
+        out.append("Found the key\n" if found else "Not found.\n")
+        return tmp
 
     def _create_node(self, key: int) -> Node:
+        if self._free:
+            node = self._free.pop()
+            node.key = key
+            node.keynext = math.inf
+            return node
         return Node(key)
 
     def _create_head(self) -> Node:
-        return Node(0, is_head=True)
+        """New empty level: a head linked to its own +inf tail sentinel, so
+        every real node has a right neighbour and links need no None checks"""
+        head = HeadNode()
+        tail = Node(math.inf)
+        head.right = tail
+        tail.left = head
+        return head
+
+    def _find_with_path(self, key: int, height: int) -> list:
+        """Descend like find(), recording the node each of the lowest
+        height + 1 levels was left from, top first; the last entry is what
+        find() would return. Levels the tower won't reach are not recorded."""
+        tmp = self.headh
+        # Levels above the new tower: plain descent, nothing to remember
+        for _ in range(self.level - height):
+            while tmp.keynext <= key:
+                tmp = tmp.right
+            tmp = tmp.down
 
-    def _insert_new_level(self, tmp: Node) -> None:
-        newnode = self._create_node(tmp.key)
-        tmp.up = newnode
-        newnode.down = tmp
+        preds = []
+        while True:
+            while tmp.keynext <= key:
+                tmp = tmp.right
+            preds.append(tmp)
+            tmp = tmp.down
+            if tmp is None:
+                return preds
 
-        leftone = tmp.left
-        while leftone is not None and not leftone.isHead and leftone.up is None:
-            leftone = leftone.left
-        
-        if leftone is None:
-            return
-
-        if leftone.isHead and leftone.up is None:
-            newhead = self._create_head()
-            leftone.up = newhead
-            newhead.down = leftone
-            newhead.right = newnode
-            newnode.left = newhead
-            self.headh = newhead
-            self.level += 1
-        else:
-            leftone = leftone.up
-            newnode.right = leftone.right
-            leftone.right = newnode
-            if newnode.right is not None:
-                newnode.right.left = newnode
-            newnode.left = leftone
-
-        if self.flip_coin():
-            self._insert_new_level(newnode)
-
-    def insert(self, key: int) -> None:
-        tmp = self.find(key)
-        if tmp is None:
-            print("Error: bad find() result")
-            return
+    def insert(self, key: int) -> bool:
+        """Insert key; returns False if it was already present"""
+        if key == self._last_key:
+            return False
+        height = self.random_height()
+        preds = self._find_with_path(key, height)
+        tmp = preds[-1]
         if not tmp.isHead and tmp.key == key:
-            print(f"Item {key} already present in the list.")
-            self.print_list()
-            return
+            return False
 
         newnode = self._create_node(key)
+        right = tmp.right
         newnode.left = tmp
-        if tmp.right is not None:
-            newnode.right = tmp.right
-            newnode.right.left = newnode
+        newnode.right = right
+        newnode.keynext = tmp.keynext
         tmp.right = newnode
+        tmp.keynext = key
+        right.left = newnode
+
+        if height:
+            self._build_tower(newnode, preds, height)
+        self._last_key = key
+        self._last_node = newnode
+        self.size += 1
+        return True
+
+    def _build_tower(self, below: Node, preds: list, height: int) -> None:
+        """Stack height nodes on top of the bottom node below, splicing each
+        in after the predecessor recorded for its level by _find_with_path"""
+        create_node = self._create_node
+        key = below.key
+        levels = len(preds)
+        for lvl in range(1, height + 1):
+            if lvl < levels:
+                pred = preds[-1 - lvl]
+            else:
+                # First tower to reach this height: open a new top level
+                pred = self._create_head()
+                pred.down = self.headh
+                self.headh = pred
+                self.level += 1
 
-        if self.flip_coin():
-            self._insert_new_level(newnode)
+            node = create_node(key)
+            right = pred.right
+            node.left = pred
+            node.right = right
+            node.keynext = pred.keynext
+            pred.right = node
+            pred.keynext = key
+            right.left = node
+            node.down = below
+            below = node
 
-        self.print_list()
+    def bulk_insert(self, keys) -> int:
+        """Insert many keys at once; returns how many of them were new.
+        A batch much larger than the list (such as loading an empty one) is
+        sorted once and the whole list is rebuilt in a single left-to-right
+        pass per level. The rebuild replaces every node, so nodes returned by
+        earlier find() calls are no longer in the list. Smaller batches are
+        inserted one key at a time and leave existing nodes in place."""
+        keys = list(keys)
+        # A rebuild touches every node already in the list, so it only pays
+        # off once the batch clearly outnumbers them
+        if len(keys) <= 2 * self.size:
+            return sum(map(self.insert, keys))
+
+        # Height of every tower already in the list, so existing nodes keep
+        # theirs: walking top level first, a key is first seen at its top
+        heights = {}
+        setdefault = heights.setdefault
+        head = self.headh
+        level = self.level
+        while head is not None:
+            node = head.right
+            while node.right is not None:
+                setdefault(node.key, level)
+                node = node.right
+            head = head.down
+            level -= 1
+        before = len(heights)
+
+        random_height = self.random_height
+        for key in keys:
+            if key not in heights:
+                heights[key] = random_height()
+        if len(heights) == before:
+            return 0
+
+        self._build(sorted(heights.items()))
+        return len(heights) - before
+
+    def _build(self, towers: list) -> None:
+        """Rebuild the whole list from (key, height) pairs sorted by key"""
+        create_node = self._create_node
+        create_head = self._create_head
+
+        top = max(height for _, height in towers)
+        heads = [create_head() for _ in range(top + 1)]
+        for below, above in zip(heads, heads[1:]):
+            above.down = below
+
+        # Rightmost node built so far on each level
+        tails = [head.right for head in heads]
+        last = heads[:]
+        for key, height in towers:
+            below = None
+            for lvl in range(height + 1):
+                node = create_node(key)
+                prev = last[lvl]
+                prev.right = node
+                prev.keynext = key
+                node.left = prev
+                node.down = below
+                last[lvl] = node
+                below = node
+
+        for node, tail in zip(last, tails):
+            node.right = tail
+            node.keynext = tail.key
+            tail.left = node
+
+        self.head0 = heads[0]
+        self.headh = heads[top]
+        self.level = top
+        self.size = len(towers)
+        self._last_key = self._last_node = None
 
     def _check_head(self) -> None:
         tmp = self.headh
-        while tmp is not None and tmp.right is None and tmp.down is not None:
-            tmpdown = tmp.down
-            tmpdown.up = None
-            tmp.down = None
-            tmp = tmpdown
-            self.level -= 1
-        self.headh = tmp
-
-    def delete(self, key: int) -> None:
-        tmp = self.find(key)
-        if tmp is None or tmp.isHead or tmp.key != key:
-            print("No such Item.")
-            self.print_list()
-            return
-        
+        # A level is empty when its head links straight to the tail sentinel;
+        # count the empty top levels, then cut them off in one step
+        drop = 0
+        while tmp.right.right is None and tmp.down is not None:
+            tmp = tmp.down
+            drop += 1
+        if drop:
+            self.headh = tmp
+            self.level -= drop
+
+    def delete(self, key: int) -> bool:
+        """Delete key; returns False if it was not in the list"""
+        # Descend like find(), stopping at the first level that lands on key:
+        # that is the top of its tower
+        tmp = self.headh
+        while True:
+            while tmp.keynext <= key:
+                tmp = tmp.right
+            if tmp.key == key and not tmp.isHead:
+                break
+            tmp = tmp.down
+            if tmp is None:
+                return False
+
+        # Unlink the tower top-down; neighbours always exist thanks to the sentinels
+        free = self._free
         while tmp is not None:
-            tmpup = tmp.up
-            if tmp.left is not None:
-                tmp.left.right = tmp.right
-            if tmp.right is not None:
-                tmp.right.left = tmp.left
-            tmp.left = tmp.right = tmp.up = tmp.down = None
-            tmp = tmpup
+            down = tmp.down
+            left = tmp.left
+            right = tmp.right
+            left.right = right
+            left.keynext = tmp.keynext
+            right.left = left
+            tmp.left = tmp.right = tmp.down = None
+            free.append(tmp)
+            tmp = down
         
+        if key == self._last_key:
+            self._last_key = self._last_node = None
+        self.size -= 1
         self._check_head()
-        self.print_list()
+        return True
+
+    def _cli_key(self, arg: Optional[str], out: list) -> Optional[int]:
+        """Parse a command's key argument, reporting problems into out"""
+        if arg is None:
+            out.append("Please enter a valid command: insert x, delete x, find x, print, quit\n")
+            return None
+        try:
+            return int(arg)
+        except ValueError:
+            out.append("Invalid number\n")
+            return None
+
+    def _cli_insert(self, arg: Optional[str], out: list) -> bool:
+        k = self._cli_key(arg, out)
+        if k is not None:
+            if not self.insert(k):
+                out.append(f"Item {k} already present in the list.\n")
+            out.append(self.format_list())
+        return True
+
+    def _cli_delete(self, arg: Optional[str], out: list) -> bool:
+        k = self._cli_key(arg, out)
+        if k is not None:
+            if not self.delete(k):
+                out.append("No such Item.\n")
+            out.append(self.format_list())
+        return True
+
+    def _cli_find(self, arg: Optional[str], out: list) -> bool:
+        k = self._cli_key(arg, out)
+        if k is not None:
+            result = self._find_traced(k, out)
+            if result and not result.isHead and result.key == k:
+                out.append(f"Key {k} exists in the list\n\n")
+            else:
+                out.append(f"Key {k} not found in the list\n\n")
+        return True
+
+    def _cli_print(self, arg: Optional[str], out: list) -> bool:
+        out.append(self.format_list())
+        return True
+
+    def _cli_quit(self, arg: Optional[str], out: list) -> bool:
+        out.append("Goodbye!\n")
+        return False
 
     def run_cli(self) -> None:
         print("Simple SkipList CLI. Commands: insert x, delete x, find x, print, quit")
+        # Command -> handler(arg, out); a handler returns False to end the session
+        commands = {
+            'insert': self._cli_insert,
+            'delete': self._cli_delete,
+            'find': self._cli_find,
+            'print': self._cli_print,
+            'quit': self._cli_quit,
+        }
         while True:
             try:
                 line = input("\nEnter your command: ").strip()
@@ -160,41 +407,18 @@ class SkipList:
                 break
             if not line:
                 continue
-            parts = line.split()
-            cmd = parts[0].lower()
-            if cmd == 'insert' and len(parts) > 1:
-                try:
-                    k = int(parts[1])
-                except ValueError:
-                    print("Invalid number")
-                    continue
-                self.insert(k)
-            elif cmd == 'delete' and len(parts) > 1:
-                try:
-                    k = int(parts[1])
-                except ValueError:
-                    print("Invalid number")
-                    continue
-                self.delete(k)
-            elif cmd == 'find' and len(parts) > 1:
-                try:
-                    k = int(parts[1])
-                except ValueError:
-                    print("Invalid number")
-                    continue
-                result = self.find(k)
-                if result and not result.isHead and result.key == k:
-                    print(f"Key {k} exists in the list")
-                else:
-                    print(f"Key {k} not found in the list")
-                print()
-            elif cmd == 'print':
-                self.print_list()
-            elif cmd == 'quit':
-                print("Goodbye!")
-                break
+            # Only the command and its first argument matter; leave the rest unsplit
+            parts = line.split(maxsplit=2)
+            handler = commands.get(parts[0].lower())
+            out = []  # Everything a command prints, written in one go
+            if handler is None:
+                out.append("Please enter a valid command: insert x, delete x, find x, print, quit\n")
+                keep_going = True
             else:
-                print("Please enter a valid command: insert x, delete x, find x, print, quit")
+                keep_going = handler(parts[1] if len(parts) > 1 else None, out)
+            sys.stdout.write("".join(out))
+            if not keep_going:
+                break
 
 
 if __name__ == '__main__':